@@ -7,6 +7,7 @@ from typing import Optional
 import typer
 
 from tempit.core import TempitManager
+from tempit.query import DirectoryQuery
 
 
 def version_callback(value: bool):
@@ -48,9 +49,19 @@ def init_shell(shell: str = typer.Argument(..., help="Shell name (e.g., bash, zs
 
 
 @app.command("list")
-def list_dirs():
-    """List all tracked temporary directories."""
-    get_manager().print_directories()
+def list_dirs(
+    sort: Optional[str] = typer.Option(None, "--sort", "-s", help="Sort by created, size or age."),
+    filters: Optional[str] = typer.Option(None, "--filter", "-f",
+                                          help="Comma-separated filters: prefix=GLOB, older=DURATION (e.g. 3d)."),
+    limit: Optional[int] = typer.Option(None, "--limit", "-n", min=0, help="Show at most N directories."),
+    offset: int = typer.Option(0, "--offset", min=0, help="Skip the first M matching directories."),
+):
+    """List tracked temporary directories."""
+    try:
+        query = DirectoryQuery.from_options(sort=sort, filters=filters, limit=limit, offset=offset)
+    except ValueError as e:
+        raise typer.BadParameter(str(e))
+    get_manager().print_directories(query)
 
 
 @app.command("remove")
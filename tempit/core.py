@@ -2,7 +2,9 @@
 
 import logging
 from pathlib import Path
+from typing import Optional
 
+from tempit.query import DirectoryQuery
 from tempit.render import DirectoryRenderer
 from tempit.services import DirectoryService
 from tempit.stats import calculate_stats
@@ -59,13 +61,15 @@ class TempitManager:
             self.logger.error("Error removing temporary directory: %s", e)
             return False
 
-    def print_directories(self) -> None:
-        """Print a formatted table of tracked temporary directories."""
+    def print_directories(self, query: Optional[DirectoryQuery] = None) -> None:
+        """Print a formatted table of tracked temporary directories matching the query."""
         self.storage.prune_stale()
-        directories = self.storage.get_all_directories()
-        all_entries = [(d, calculate_stats(d)) for d in directories]
-        entries = [(d, s) for d, s in all_entries if s is not None]
-        self.renderer.render_directory_list(entries)
+        directories = list(enumerate(self.storage.get_all_directories(), start=1))
+        results = (query or DirectoryQuery()).execute(directories, calculate_stats)
+        self.renderer.render_directory_list(
+            [(d, s) for _, d, s in results],
+            numbers=[n for n, _, _ in results],
+        )
 
     def get_path_by_number(self, number: int) -> Path | None:
         """Return the path for a tracked directory by its number."""
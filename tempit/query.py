@@ -0,0 +1,125 @@
+"""Query layer for selecting, ordering and paginating tracked directories."""
+
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from fnmatch import fnmatchcase
+from typing import Callable, Dict, List, Optional, Tuple
+
+from tempit.models import DirectoryInfo, DirectoryStats
+
+SORT_KEYS = ("created", "size", "age")
+
+_DURATION_UNITS = {
+    "s": "seconds",
+    "m": "minutes",
+    "h": "hours",
+    "d": "days",
+    "w": "weeks",
+}
+_DURATION_RE = re.compile(r"^(\d+)([smhdw])$")
+
+NumberedDirectory = Tuple[int, DirectoryInfo]
+StatsFunc = Callable[[DirectoryInfo], Optional[DirectoryStats]]
+
+
+def parse_duration(value: str) -> timedelta:
+    """Parse a duration such as '30m', '12h' or '3d'. Raises ValueError if invalid."""
+    match = _DURATION_RE.match(value.strip())
+    if match is None:
+        raise ValueError(f"Invalid duration: {value!r} (expected e.g. 30m, 12h, 3d, 2w)")
+    amount, unit = match.groups()
+    return timedelta(**{_DURATION_UNITS[unit]: int(amount)})
+
+
+@dataclass
+class DirectoryQuery:
+    """Selection, ordering and pagination options for listing directories."""
+
+    sort: Optional[str] = None
+    prefix: Optional[str] = None
+    older: Optional[timedelta] = None
+    limit: Optional[int] = None
+    offset: int = 0
+
+    def __post_init__(self) -> None:
+        if self.sort is not None and self.sort not in SORT_KEYS:
+            raise ValueError(f"Invalid sort key: {self.sort!r} (expected one of {', '.join(SORT_KEYS)})")
+        if self.limit is not None and self.limit < 0:
+            raise ValueError(f"Invalid limit: {self.limit}")
+        if self.offset < 0:
+            raise ValueError(f"Invalid offset: {self.offset}")
+
+    @classmethod
+    def from_options(
+        cls,
+        sort: Optional[str] = None,
+        filters: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> "DirectoryQuery":
+        """Build a query from CLI options. `filters` is a 'key=value,...' string."""
+        parsed: Dict[str, str] = {}
+        for item in (filters or "").split(","):
+            if not item.strip():
+                continue
+            key, sep, value = item.partition("=")
+            key = key.strip()
+            if not sep or key not in ("prefix", "older"):
+                raise ValueError(f"Invalid filter: {item!r} (expected prefix=... or older=...)")
+            parsed[key] = value.strip()
+
+        older = parse_duration(parsed["older"]) if "older" in parsed else None
+        return cls(sort=sort, prefix=parsed.get("prefix"), older=older, limit=limit, offset=offset)
+
+    def matches(self, dir_info: DirectoryInfo, now: datetime) -> bool:
+        """Return True if the directory passes all filters on stored fields."""
+        if self.prefix is not None and not fnmatchcase(dir_info.prefix, self.prefix):
+            return False
+        if self.older is not None and now - dir_info.created < self.older:
+            return False
+        return True
+
+    def paginate(self, items: list) -> list:
+        """Apply offset and limit to an already ordered list."""
+        end = None if self.limit is None else self.offset + self.limit
+        return items[self.offset:end]
+
+    def execute(
+        self,
+        directories: List[NumberedDirectory],
+        stats_func: StatsFunc,
+    ) -> List[Tuple[int, DirectoryInfo, DirectoryStats]]:
+        """Filter, sort and paginate directories, computing stats only where needed.
+
+        Stored-field filters and sorts run first so `stats_func` is only called on the
+        rows that are displayed. Sorting by size needs stats for every matching row,
+        so in that case they are computed before pagination.
+        """
+        now = datetime.now()
+        selected = [(n, d) for n, d in directories if self.matches(d, now)]
+
+        if self.sort == "size":
+            entries = _with_stats(selected, stats_func)
+            entries.sort(key=lambda entry: entry[2].size_bytes, reverse=True)
+            return self.paginate(entries)
+
+        if self.sort == "created":
+            selected.sort(key=lambda entry: entry[1].created)
+        elif self.sort == "age":
+            selected.sort(key=lambda entry: entry[1].created, reverse=True)
+
+        return _with_stats(self.paginate(selected), stats_func)
+
+
+def _with_stats(
+    directories: List[NumberedDirectory],
+    stats_func: StatsFunc,
+) -> List[Tuple[int, DirectoryInfo, DirectoryStats]]:
+    """Attach stats to each directory, dropping those whose path no longer exists."""
+    entries = []
+    for number, dir_info in directories:
+        stats = stats_func(dir_info)
+        if stats is not None:
+            entries.append((number, dir_info, stats))
+    return entries
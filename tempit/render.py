@@ -1,7 +1,7 @@
 """Render directory information as a rich table."""
 
 import sys
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from rich.console import Console
 from rich.table import Table
@@ -16,8 +16,12 @@ class DirectoryRenderer:  # pylint: disable=too-few-public-methods
         self,
         entries: List[Tuple[DirectoryInfo, DirectoryStats]],
         title: str = "Temporary Directories",
+        numbers: Optional[List[int]] = None,
     ) -> None:
-        """Render a list of (info, stats) pairs as a rich table."""
+        """Render a list of (info, stats) pairs as a rich table.
+
+        `numbers` gives the tracking number shown for each entry; defaults to 1..N.
+        """
         console = Console(file=sys.stdout, width=None if sys.stdout.isatty() else 220)
 
         if not entries:
@@ -33,8 +37,11 @@ class DirectoryRenderer:  # pylint: disable=too-few-public-methods
         table.add_column("Age")
         table.add_column("Contents")
 
-        for i, (dir_info, stats) in enumerate(entries):
-            table.add_row(*self._create_table_row(dir_info, stats, i))
+        if numbers is None:
+            numbers = list(range(1, len(entries) + 1))
+
+        for number, (dir_info, stats) in zip(numbers, entries):
+            table.add_row(*self._create_table_row(dir_info, stats, number))
 
         console.print()
         console.print(table)
@@ -44,7 +51,7 @@ class DirectoryRenderer:  # pylint: disable=too-few-public-methods
         self,
         dir_info: DirectoryInfo,
         stats: DirectoryStats,
-        index: int,
+        number: int,
     ) -> List[str]:
         created_str = dir_info.created.strftime("%Y-%m-%d %H:%M")
 
@@ -63,7 +70,7 @@ class DirectoryRenderer:  # pylint: disable=too-few-public-methods
         contents = f"[blue]{stats.file_count}[/blue] files, [blue]{stats.dir_count}[/blue] dirs"
 
         return [
-            str(index + 1),
+            str(number),
             dir_info.prefix,
             str(dir_info.path),
             size_markup,
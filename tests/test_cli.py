@@ -77,3 +77,26 @@ def test_cli_clean_all(create_manager, monkeypatch):
 
     list_dir = create_manager.storage.get_all_directories()
     assert len(list_dir) == 0
+
+
+def test_cli_list_with_query(create_manager, monkeypatch):
+    """Test filtering and limiting the listing via CLI"""
+    monkeypatch.setattr(cli, "get_manager", lambda: create_manager)
+
+    create_manager.create("build_one")
+    create_manager.create("other")
+    create_manager.create("build_two")
+
+    result = runner.invoke(cli.app, ["list", "--filter", "prefix=build*", "--sort", "age", "--limit", "1"])
+    assert result.exit_code == 0
+    assert "build_two" in result.output
+    assert "build_one" not in result.output
+    assert "other" not in result.output
+
+
+def test_cli_list_rejects_invalid_sort(create_manager, monkeypatch):
+    """Test that an unknown sort key is reported as a usage error"""
+    monkeypatch.setattr(cli, "get_manager", lambda: create_manager)
+
+    result = runner.invoke(cli.app, ["list", "--sort", "name"])
+    assert result.exit_code == 2
@@ -0,0 +1,84 @@
+"""Tests for the directory query layer."""
+# pylint: disable=missing-function-docstring,redefined-outer-name
+
+from datetime import datetime, timedelta
+
+import pytest
+from tempit.models import DirectoryInfo, DirectoryStats
+from tempit.query import DirectoryQuery, parse_duration
+
+
+@pytest.fixture
+def directories(tmp_path):
+    now = datetime.now()
+    return [
+        (1, DirectoryInfo(path=tmp_path / "build_a", created=now - timedelta(days=5), prefix="build")),
+        (2, DirectoryInfo(path=tmp_path / "test_b", created=now - timedelta(hours=1), prefix="test")),
+        (3, DirectoryInfo(path=tmp_path / "build_c", created=now - timedelta(days=1), prefix="build_x")),
+    ]
+
+
+class StatsRecorder:  # pylint: disable=too-few-public-methods
+    """Fake stats function that records which directories were walked."""
+
+    def __init__(self, sizes=None):
+        self.sizes = sizes or {}
+        self.calls = []
+
+    def __call__(self, dir_info):
+        self.calls.append(dir_info.path.name)
+        size = self.sizes.get(dir_info.path.name, 0)
+        return DirectoryStats(size_bytes=size, human_size=str(size), file_count=0, dir_count=0, age="")
+
+
+def test_parse_duration():
+    assert parse_duration("3d") == timedelta(days=3)
+    assert parse_duration("12h") == timedelta(hours=12)
+    with pytest.raises(ValueError):
+        parse_duration("3 days")
+
+
+def test_from_options_parses_filters():
+    query = DirectoryQuery.from_options(sort="age", filters="prefix=build*,older=2d", limit=5, offset=1)
+    assert query == DirectoryQuery(sort="age", prefix="build*", older=timedelta(days=2), limit=5, offset=1)
+
+
+@pytest.mark.parametrize("kwargs", [{"sort": "name"}, {"filters": "owner=me"}, {"filters": "older"}])
+def test_from_options_rejects_invalid_input(kwargs):
+    with pytest.raises(ValueError):
+        DirectoryQuery.from_options(**kwargs)
+
+
+def test_default_query_keeps_storage_order(directories):
+    results = DirectoryQuery().execute(directories, StatsRecorder())
+    assert [n for n, _, _ in results] == [1, 2, 3]
+
+
+def test_filters_run_before_stats(directories):
+    stats = StatsRecorder()
+    results = DirectoryQuery(prefix="build*", older=timedelta(days=2)).execute(directories, stats)
+    assert [n for n, _, _ in results] == [1]
+    assert stats.calls == ["build_a"]
+
+
+def test_sort_and_paginate_only_walks_shown_rows(directories):
+    stats = StatsRecorder()
+    results = DirectoryQuery(sort="age", limit=1, offset=1).execute(directories, stats)
+    assert [n for n, _, _ in results] == [3]
+    assert stats.calls == ["build_c"]
+
+
+def test_sort_by_created_is_oldest_first(directories):
+    results = DirectoryQuery(sort="created").execute(directories, StatsRecorder())
+    assert [n for n, _, _ in results] == [1, 3, 2]
+
+
+def test_sort_by_size_is_largest_first(directories):
+    stats = StatsRecorder({"build_a": 10, "test_b": 30, "build_c": 20})
+    results = DirectoryQuery(sort="size", limit=2).execute(directories, stats)
+    assert [n for n, _, _ in results] == [2, 3]
+
+
+def test_missing_directories_are_dropped(directories):
+    results = DirectoryQuery().execute(directories, lambda d: None)
+    assert not results